@@ -1,5 +1,6 @@
 from pathlib import Path
 import sys
+from uuid import UUID
 
 from resources.application.use_cases.updating_name import UpdateName, UpdatingName
 
@@ -21,8 +22,10 @@ def list_all_resources(json_path: Path) -> None:
     list_resources = JsonFileListResources(json_path)
     print(f"{'id': ^38}{'type': ^8}name")
     print(f"{'':-<38}{'':-<8}{'':-<20}")
-    for res in list_resources.query():
-        print(f"{res.id: <38}{res.type: <8}{res.name}")
+    rows = "".join(
+        f"{res.id: <38}{res.type: <8}{res.name}\n" for res in list_resources.query()
+    )
+    sys.stdout.write(rows)
 
 
 def update_name(rest: list[str], json_path: Path) -> None:
@@ -32,7 +35,7 @@ def update_name(rest: list[str], json_path: Path) -> None:
         sys.exit(1)
     resource_repo = JsonFileResourceRepository(json_path)
     uc = UpdatingName(repo=resource_repo)
-    input_dto = UpdateName(id=resource_id,name=name)
+    input_dto = UpdateName(id=UUID(resource_id), name=name)
     uc.execute(input_dto)
     print(f"resource '{resource_id}' updated")
 
@@ -1,5 +1,6 @@
 from pathlib import Path
 import sys
+from uuid import UUID
 
 from resources.main import AppContext, bootstrap_app
 
@@ -19,8 +20,11 @@ def main() -> None:
 def list_all_resources(app_context: AppContext) -> None:
     print(f"{'id': ^38}{'type': ^8}name")
     print(f"{'':-<38}{'':-<8}{'':-<20}")
-    for res in app_context.list_resources.query():
-        print(f"{res.id: <38}{res.type: <8}{res.name}")
+    rows = "".join(
+        f"{res.id: <38}{res.type: <8}{res.name}\n"
+        for res in app_context.list_resources.query()
+    )
+    sys.stdout.write(rows)
 
 
 def update_name(rest: list[str], app_context: AppContext) -> None:
@@ -28,7 +32,7 @@ def update_name(rest: list[str], app_context: AppContext) -> None:
     if not resource_id or not name:
         print("You must give resource_id and name")
         sys.exit(1)
-    input_dto = UpdateName(id=resource_id,name=name)
+    input_dto = UpdateName(id=UUID(resource_id), name=name)
     app_context.command_bus.dispatch(input_dto)
     print(f"resource '{resource_id}' updated")
 
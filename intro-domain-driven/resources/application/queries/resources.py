@@ -2,7 +2,7 @@ import abc
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ResourceDto:
     id: str
     name: str
@@ -1,4 +1,3 @@
-import copy
 from uuid import UUID
 
 from resources.application.repositories.resources import ResourceRepository
@@ -10,7 +9,7 @@ class InMemoryResourceRepository(ResourceRepository):
         self._resources = {}
 
     def save(self, resource: Resource) -> None:
-        self._resources[resource.id] = copy.deepcopy(resource)
+        self._resources[resource.id] = resource
 
     def get(self, id: UUID) -> Resource:
-        return copy.deepcopy(self._resources[id])
+        return self._resources[id]
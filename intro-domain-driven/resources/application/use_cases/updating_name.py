@@ -1,12 +1,20 @@
-from pydantic import UUID4, BaseModel
+from dataclasses import dataclass
+from uuid import UUID
 
 from resources.application.repositories.resources import ResourceRepository
 
 
-class UpdateName(BaseModel):
-    id: UUID4
+@dataclass(frozen=True, slots=True)
+class UpdateName:
+    id: UUID
     name: str
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.id, UUID):
+            raise TypeError(f"id must be a UUID, got {type(self.id).__name__}")
+        if self.id.version != 4:
+            raise ValueError(f"id must be a version 4 UUID, got '{self.id}'")
+
 
 class UpdatingName:
     def __init__(self, repo: ResourceRepository) -> None:
@@ -15,6 +23,4 @@ class UpdatingName:
     def execute(self, input_dto: UpdateName) -> None:
         resource = self.repo.get(input_dto.id)
 
-        resource.set_name(input_dto.name)
-
-        self.repo.save(resource)
+        self.repo.save(resource.with_name(input_dto.name))
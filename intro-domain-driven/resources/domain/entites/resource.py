@@ -1,3 +1,4 @@
+import dataclasses
 import enum
 from uuid import UUID
 
@@ -7,36 +8,35 @@ class ResourceType(str, enum.Enum):
     Lexicon = "lexicon"
 
 
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True, eq=False)
 class Resource:
-    def __init__(
-        self,
+    id: UUID
+    name: str
+    type: ResourceType
+    comment: str | None = None
+
+    @classmethod
+    def create(
+        cls,
         *,
         id: UUID,
         name: str,
         type_: ResourceType | str,
         comment: str | None = None,
-    ) -> None:
-        self._id = id
-        self._name = name
-        self._type = ResourceType(type_) if isinstance(type_, str) else type_
-        self._comment = comment
+    ) -> "Resource":
+        if not isinstance(type_, ResourceType):
+            type_ = ResourceType(type_)
+        return cls(id=id, name=name, type=type_, comment=comment)
 
-    @property
-    def id(self) -> UUID:
-        return self._id
+    def __eq__(self, other: object) -> bool:
+        # an entity is identified by its id, not by its current attributes
+        if not isinstance(other, Resource):
+            return NotImplemented
+        return self.id == other.id
 
-    @property
-    def name(self) -> str:
-        return self._name
+    def __hash__(self) -> int:
+        return hash(self.id)
 
-    @property
-    def comment(self) -> str | None:
-        return self._comment
-
-    @property
-    def type(self) -> ResourceType:
-        return self._type
-
-    def set_name(self, name: str) -> None:
+    def with_name(self, name: str) -> "Resource":
         # TODO validate name
-        self._name = name
+        return dataclasses.replace(self, name=name)
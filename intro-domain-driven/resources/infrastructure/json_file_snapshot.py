@@ -0,0 +1,19 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+
+@dataclass(frozen=True)
+class JsonFileSnapshot:
+    path: Path
+    stat: os.stat_result
+    data: dict[str, Any]
+
+    @classmethod
+    def read(cls, path: Path) -> "JsonFileSnapshot":
+        # stat before reading, so that a concurrent rewrite shows up as a change
+        stat = path.stat()
+        return cls(path=path, stat=stat, data=orjson.loads(path.read_bytes()))
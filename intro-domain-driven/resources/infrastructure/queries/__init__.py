@@ -10,5 +10,5 @@ class JsonFileListResources(ListResources):
 
     def query(self) -> list[dict[str, str]]:
         return [
-            res | {"id": id} for id, res in json.loads(self._path.read_text()).items()
+            res | {"id": id} for id, res in json.loads(self._path.read_bytes()).items()
         ]
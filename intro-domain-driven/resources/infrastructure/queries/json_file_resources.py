@@ -1,15 +1,37 @@
-import json
+import os
 from pathlib import Path
+from typing import Any
+
+import orjson
 
 from resources.application.queries.resources import ListResources, ResourceDto
+from resources.infrastructure.json_file_snapshot import JsonFileSnapshot
 
 
 class JsonFileListResources(ListResources):
-    def __init__(self, path: Path) -> None:
-        self._path = path
+    def __init__(self, source: Path | JsonFileSnapshot) -> None:
+        self._cache: tuple[tuple[int, ...], tuple[ResourceDto, ...]] | None = None
+        if isinstance(source, JsonFileSnapshot):
+            self._path = source.path
+            self._cache = (self._cache_key(source.stat), self._to_dtos(source.data))
+        else:
+            self._path = source
 
     def query(self) -> list[ResourceDto]:
-        return [
+        st = self._path.stat()
+        key = self._cache_key(st)
+        if self._cache is None or self._cache[0] != key:
+            self._cache = (key, self._to_dtos(orjson.loads(self._path.read_bytes())))
+        return list(self._cache[1])
+
+    @staticmethod
+    def _cache_key(st: os.stat_result) -> tuple[int, int, int, int]:
+        # the inode and ctime make a same-size rewrite within the mtime
+        # granularity much less likely to be missed, though not impossible
+        return (st.st_ino, st.st_ctime_ns, st.st_mtime_ns, st.st_size)
+
+    def _to_dtos(self, data: dict[str, Any]) -> tuple[ResourceDto, ...]:
+        return tuple(
             ResourceDto(id=id, name=res["name"], type=res["type"])
-            for id, res in json.loads(self._path.read_text()).items()
-        ]
+            for id, res in data.items()
+        )
@@ -1,46 +1,82 @@
-import copy
+import os
+import shutil
+import tempfile
 from pathlib import Path
-import json
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 
+import orjson
+
 from resources.application.repositories.resources import ResourceRepository
-from resources.domain.entites.resource import Resource, ResourceType
+from resources.domain.entites.resource import Resource
+from resources.infrastructure.json_file_snapshot import JsonFileSnapshot
 
 
 class JsonFileResourceRepository(ResourceRepository):
-    def __init__(self, path: Path) -> None:
-        self._path = path
-        self._resources: dict[UUID, Resource] = {}
-        self.load_from_path(self._path)
+    def __init__(self, source: Path | JsonFileSnapshot) -> None:
+        self._raw: dict[str, Any] = {}
+        if isinstance(source, JsonFileSnapshot):
+            self._path = source.path
+            self._load(source.data)
+        else:
+            self._path = source
+            self.load_from_path(self._path)
 
     def load_from_path(self, path: Path) -> None:
-        for id, data in json.loads(self._path.read_text()).items():
-            uuid = UUID(id)
-            resource = Resource(
-                id=uuid,
-                name=data["name"],
-                type_=ResourceType(data["type"]),
-                comment=data.get("comment"),
-            )
-            self._resources[uuid] = resource
+        self._load(orjson.loads(self._path.read_bytes()))
+
+    def _load(self, data: dict[str, Any]) -> None:
+        # keys must match str(UUID) in get(); only ids that can't already be in
+        # that form (e.g. uppercase ones) are parsed and normalized
+        self._raw = {
+            id if len(id) == 36 and id.islower() else str(UUID(id)): res
+            for id, res in data.items()
+        }
 
     def get(self, id: UUID) -> Resource:
-        return copy.deepcopy(self._resources[id])
+        data = self._raw[str(id)]
+        return Resource.create(
+            id=id,
+            name=data["name"],
+            type_=data["type"],
+            comment=data.get("comment"),
+        )
 
     def save(self, resource: Resource) -> None:
-        self._resources[resource.id] = copy.deepcopy(resource)
+        self._raw[str(resource.id)] = {
+            "name": resource.name,
+            "type": resource.type.value,
+            "comment": resource.comment,
+        }
         self.write_to_path()
 
     def write_to_path(self, path: Optional[Path] = None):
-        to_disk = {
-            str(res.id): {
-                "name": res.name,
-                "type": str(res.type.value),
-                "comment": res.comment,
-            }
-            for res in self._resources.values()
-        }
         if path:
             self._path = path
-        self._path.write_text(json.dumps(to_disk))
+        fp = tempfile.NamedTemporaryFile(
+            dir=self._path.parent,
+            prefix=f"{self._path.name}.",
+            suffix=".tmp",
+            delete=False,
+        )
+        tmp_path = Path(fp.name)
+        try:
+            with fp:
+                fp.write(orjson.dumps(self._raw))
+                fp.flush()
+                os.fsync(fp.fileno())
+            if self._path.exists():
+                shutil.copymode(self._path, tmp_path)
+            else:
+                os.chmod(tmp_path, 0o666 & ~_umask())
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+
+def _umask() -> int:
+    # there is no way to read the umask without setting it
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from resources.infrastructure.json_file_snapshot import JsonFileSnapshot
+
 from resources.infrastructure.queries.json_file_resources import JsonFileListResources
 
 from resources.application.queries.resources import ListResources
@@ -14,11 +16,10 @@ class CommandBus:
         self._cmp_map = {}
 
     def register(self, cmd_type, cmd_handler) -> None:
-        self._cmp_map[cmd_type] = cmd_handler
+        self._cmp_map[cmd_type] = cmd_handler.execute
 
     def dispatch(self, cmd) -> None:
-        handler = self._cmp_map[type(cmd)]
-        handler.execute(cmd)
+        self._cmp_map[type(cmd)](cmd)
 
 
 class AppContext:
@@ -31,11 +32,15 @@ def bootstrap_app(json_path: Path | str) -> AppContext:
     if not isinstance(json_path, Path):
         json_path = Path(json_path)
 
+    # parse the file once and share the result between the repo and the query
+    snapshot = JsonFileSnapshot.read(json_path)
+
     command_bus = CommandBus()
-    resource_repo = JsonFileResourceRepository(json_path)
+    resource_repo = JsonFileResourceRepository(snapshot)
 
     update_name_handler = UpdatingName(repo=resource_repo)
     command_bus.register(UpdateName, update_name_handler)
     return AppContext(
-        command_bus=command_bus, list_resources=JsonFileListResources(json_path)
+        command_bus=command_bus,
+        list_resources=JsonFileListResources(snapshot),
     )
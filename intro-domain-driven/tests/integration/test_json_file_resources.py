@@ -1,13 +1,17 @@
 import json
+import os
 from pathlib import Path
 from uuid import UUID
 
 import pytest
 
+from resources.infrastructure.json_file_snapshot import JsonFileSnapshot
+from resources.infrastructure.queries.json_file_resources import JsonFileListResources
 from resources.infrastructure.repositories.json_file_resources import (
     JsonFileResourceRepository,
 )
 from resources.application.use_cases.updating_name import UpdateName, UpdatingName
+from resources.main import bootstrap_app
 
 
 @pytest.fixture()
@@ -19,6 +23,7 @@ def resource_id():
 def json_path(resource_id: UUID) -> Path:
     path = Path("tests/assets/generated/resources.json")
     data = {str(resource_id): {"name": "NOT SET", "type": "lexicon"}}
+    path.unlink(missing_ok=True)
     path.write_text(json.dumps(data))
     return path
 
@@ -38,3 +43,125 @@ def test_updating_name_succeeds(resource_id: UUID, json_path: Path):
     resource = repo_copy.get(resource_id)
 
     assert resource.name == "Lexicon Royale"
+
+
+def test_save_replaces_file_without_leaving_tmp(resource_id: UUID, json_path: Path):
+    repo = JsonFileResourceRepository(json_path)
+    inode = json_path.stat().st_ino
+
+    UpdatingName(repo=repo).execute(UpdateName(id=resource_id, name="Lexicon Royale"))
+
+    data = json.loads(json_path.read_bytes())
+    assert data[str(resource_id)]["name"] == "Lexicon Royale"
+    assert json_path.stat().st_ino != inode
+    assert not list(json_path.parent.glob(f"{json_path.name}.*.tmp"))
+
+
+def test_save_keeps_file_mode(resource_id: UUID, json_path: Path):
+    json_path.chmod(0o640)
+    repo = JsonFileResourceRepository(json_path)
+
+    UpdatingName(repo=repo).execute(UpdateName(id=resource_id, name="Lexicon Royale"))
+
+    assert json_path.stat().st_mode & 0o777 == 0o640
+
+
+def test_write_to_new_path_uses_default_mode(json_path: Path):
+    new_path = json_path.with_name("new_resources.json")
+    new_path.unlink(missing_ok=True)
+    umask = os.umask(0o022)
+    try:
+        JsonFileResourceRepository(json_path).write_to_path(new_path)
+    finally:
+        os.umask(umask)
+
+    assert new_path.stat().st_mode & 0o777 == 0o644
+
+
+def test_failed_save_keeps_file_and_removes_tmp(
+    resource_id: UUID, json_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    repo = JsonFileResourceRepository(json_path)
+    original = json_path.read_bytes()
+
+    def fail_replace(src, dst):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        UpdatingName(repo=repo).execute(UpdateName(id=resource_id, name="Lost"))
+
+    assert json_path.read_bytes() == original
+    assert not list(json_path.parent.glob(f"{json_path.name}.*.tmp"))
+
+
+def test_get_finds_non_canonical_id(resource_id: UUID, json_path: Path):
+    data = {str(resource_id).upper(): {"name": "UPPER", "type": "lexicon"}}
+    json_path.write_text(json.dumps(data))
+
+    repo = JsonFileResourceRepository(json_path)
+
+    assert repo.get(resource_id).name == "UPPER"
+
+
+def test_list_resources_sees_updated_name(resource_id: UUID, json_path: Path):
+    list_resources = JsonFileListResources(json_path)
+    assert [res.name for res in list_resources.query()] == ["NOT SET"]
+
+    repo = JsonFileResourceRepository(json_path)
+    UpdatingName(repo=repo).execute(UpdateName(id=resource_id, name="Lexicon Royale"))
+
+    assert [res.name for res in list_resources.query()] == ["Lexicon Royale"]
+
+
+def test_list_resources_sees_same_length_rename(resource_id: UUID, json_path: Path):
+    repo = JsonFileResourceRepository(json_path)
+    uc = UpdatingName(repo=repo)
+    uc.execute(UpdateName(id=resource_id, name="Lexicon A"))
+    list_resources = JsonFileListResources(json_path)
+    assert [res.name for res in list_resources.query()] == ["Lexicon A"]
+    before = json_path.stat()
+
+    uc.execute(UpdateName(id=resource_id, name="Lexicon B"))
+    # simulate a filesystem with coarse mtimes
+    os.utime(json_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert json_path.stat().st_size == before.st_size
+
+    assert [res.name for res in list_resources.query()] == ["Lexicon B"]
+
+
+def test_list_resources_result_can_be_mutated(json_path: Path):
+    list_resources = JsonFileListResources(json_path)
+
+    list_resources.query().clear()
+
+    assert [res.name for res in list_resources.query()] == ["NOT SET"]
+
+
+def test_list_resources_with_stale_data_rereads_file(json_path: Path):
+    snapshot = JsonFileSnapshot.read(json_path)
+    json_path.write_text(json.dumps({"abc": {"name": "NEW", "type": "corpus"}}))
+
+    list_resources = JsonFileListResources(snapshot)
+
+    assert [res.name for res in list_resources.query()] == ["NEW"]
+
+
+def test_bootstrap_app_parses_file_once(
+    resource_id: UUID, json_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    reads = []
+    read_bytes = Path.read_bytes
+    monkeypatch.setattr(
+        Path, "read_bytes", lambda self: reads.append(self) or read_bytes(self)
+    )
+
+    app_context = bootstrap_app(json_path)
+    assert [res.name for res in app_context.list_resources.query()] == ["NOT SET"]
+    assert len(reads) == 1
+
+    app_context.command_bus.dispatch(UpdateName(id=resource_id, name="Lexicon A"))
+    app_context.command_bus.dispatch(UpdateName(id=resource_id, name="Lexicon B"))
+
+    assert [res.name for res in app_context.list_resources.query()] == ["Lexicon B"]
+    assert JsonFileResourceRepository(json_path).get(resource_id).name == "Lexicon B"
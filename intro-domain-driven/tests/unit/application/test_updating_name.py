@@ -24,7 +24,7 @@ def resource_id() -> UUID:
 def repo_with_resource(
     repo: ResourceRepository, resource_id: UUID
 ) -> ResourceRepository:
-    repo.save(Resource(id=resource_id, name="RANDOM", type_=ResourceType.Lexicon))
+    repo.save(Resource(id=resource_id, name="RANDOM", type=ResourceType.Lexicon))
     return repo
 
 
@@ -42,3 +42,15 @@ def test_updating_name_succeeds(
     resource = repo_with_resource.get(resource_id)
 
     assert resource.name == "Lexicon Royale"
+
+
+def test_update_name_requires_uuid4():
+    with pytest.raises(ValueError):
+        UpdateName(
+            id=UUID("d6ba5e0a-c86e-11f1-a72b-02fc00000001"), name="Lexicon Royale"
+        )
+
+
+def test_update_name_requires_uuid_not_str(resource_id: UUID):
+    with pytest.raises(TypeError):
+        UpdateName(id=str(resource_id), name="Lexicon Royale")  # type: ignore[arg-type]
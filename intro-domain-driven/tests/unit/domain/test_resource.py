@@ -4,15 +4,37 @@ from resources.domain.entites.resource import Resource, ResourceType
 
 
 def test_can_create_resource():
-    resource = Resource(id=uuid.uuid4(), name="Lexicon Rex", type_="lexicon")
+    resource = Resource.create(id=uuid.uuid4(), name="Lexicon Rex", type_="lexicon")
 
     assert resource.type == ResourceType.Lexicon
     assert resource.name == "Lexicon Rex"
 
 
 def test_can_create_resource_with_comment():
-    resource = Resource(
+    resource = Resource.create(
         id=uuid.uuid4(), name="Lexicon Rex", type_="lexicon", comment="Comment"
     )
 
     assert resource.comment == "Comment"
+
+
+def test_with_name_returns_renamed_copy():
+    resource = Resource.create(id=uuid.uuid4(), name="Lexicon Rex", type_="lexicon")
+
+    renamed = resource.with_name("Lexicon Royale")
+
+    assert renamed.id == resource.id
+    assert renamed.name == "Lexicon Royale"
+    assert resource.name == "Lexicon Rex"
+
+
+def test_resources_with_same_id_are_equal():
+    resource = Resource.create(id=uuid.uuid4(), name="Lexicon Rex", type_="lexicon")
+
+    renamed = resource.with_name("Lexicon Royale")
+
+    assert renamed == resource
+    assert hash(renamed) == hash(resource)
+    assert resource != Resource.create(
+        id=uuid.uuid4(), name="Lexicon Rex", type_="lexicon"
+    )